@@ -1,4 +1,4 @@
-__all__ = ['ActuatorDisk', 'BEM', 'AutoBEM', 'BladeElement', 'BEMPerf', 'BEMPerfData']
+__all__ = ['ActuatorDisk', 'BEM', 'AutoBEM', 'BladeElement', 'BEMPerf', 'BEMPerfData', 'UnsteadyBEM']
 
 from math import pi, cos, sin, tan
 
@@ -7,7 +7,7 @@ from scipy.optimize import fsolve
 from scipy.interpolate import interp1d
 
 from openmdao.main.api import Component, Assembly, VariableTree
-from openmdao.lib.datatypes.api import Float, Int, Array, VarTree
+from openmdao.lib.datatypes.api import Float, Int, Bool, Array, VarTree
 from openmdao.lib.components.api import LinearDistribution
 
 
@@ -256,6 +256,19 @@ class AutoBEM(BEM):
         self.driver.workflow.add('perf')
 
 
+# rough linear interpolation from naca 0012 airfoil data, shared by
+# BladeElement and UnsteadyBEM; works on scalars and arrays of angles
+_cl_interp = interp1d(np.array([0., 13., 15, 20, 30])*pi/180, [0, 1.3, .8, .7, 1.1],
+                      fill_value=0.001, bounds_error=False)
+_cd_interp = interp1d(np.array([0., 10, 20, 30, 40])*pi/180, [0., 0., 0.3, 0.6, 1.],
+                      fill_value=0.001, bounds_error=False)
+
+
+def _coeff_lookup(alpha):
+    """drag and lift coefficients for the angle of attack alpha, in rad"""
+    return _cd_interp(alpha), _cl_interp(alpha)
+
+
 class BladeElement(Component):
     """Calculations for a single radial slice of a rotor blade"""
 
@@ -286,20 +299,8 @@ class BladeElement(Component):
     lambda_r = Float(8, iotype="out", desc="local tip speed ratio")
     phi = Float(1.487, iotype="out", desc="relative flow angle onto blades", units="rad")
 
-    def __init__(self):
-        super(BladeElement, self).__init__()
-
-        # rough linear interpolation from naca 0012 airfoil data
-        rad = np.array([0., 13., 15, 20, 30])*pi/180
-        self.cl_interp = interp1d(rad, [0, 1.3, .8, .7, 1.1], fill_value=0.001, bounds_error=False)
-
-        rad = np.array([0., 10, 20, 30, 40])*pi/180
-        self.cd_interp = interp1d(rad, [0., 0., 0.3, 0.6, 1.], fill_value=0.001, bounds_error=False)
-
     def _coeff_lookup(self, i):
-        C_L = self.cl_interp(i)
-        C_D = self.cd_interp(i)
-        return C_D, C_L
+        return _coeff_lookup(i)
 
     def execute(self):
         self.sigma = self.B*self.chord / (2 * np.pi * self.r)
@@ -331,6 +332,197 @@ class BladeElement(Component):
 
         return (X[0]-self.a), (X[1]-self.b)
 
+
+class UnsteadyBEM(Component):
+    """Azimuth resolved blade element momentum model for sheared and yawed inflow.
+
+    All blade elements and azimuth steps of a revolution are solved at once as
+    (n_elements, n_azimuth) arrays. The model is quasi-steady with no dynamic
+    inflow, so the loads are periodic: one converged revolution gives the
+    loads of every later revolution, and no time marching over revolutions is
+    done. For the same reason every blade sees the first blade's load
+    history shifted by 1/B of a revolution, so only one blade is solved. The inflow factors are found by relaxed fixed point
+    passes, at most max_iter of them, until the residual drops below tol.
+    With warm_start set, the passes start from the induction of the previous
+    execution instead of a_init and b_init.
+    """
+
+    # physical properties inputs
+    r_hub = Float(0.2, iotype="in", desc="blade hub radius", units="m", low=0)
+    twist_hub = Float(29, iotype="in", desc="twist angle at the hub radius", units="deg")
+    chord_hub = Float(.7, iotype="in", desc="chord length at the rotor hub", units="m", low=.05)
+    r_tip = Float(5, iotype="in", desc="blade tip radius", units="m")
+    twist_tip = Float(-3.58, iotype="in", desc="twist angle at the tip radius", units="deg")
+    chord_tip = Float(.187, iotype="in", desc="chord length at the rotor tip", units="m", low=.05)
+    pitch = Float(0, iotype="in", desc="overall blade pitch", units="deg")
+    rpm = Float(107, iotype="in", desc="rotations per minute, must be positive", low=0, units="min**-1")
+    B = Int(3, iotype="in", desc="number of blades", low=1)
+
+    # wind condition inputs
+    free_stream = VarTree(FlowConditions(), iotype="in")
+    hub_height = Float(30., iotype="in", desc="hub height, where free_stream.V is measured, must exceed r_tip",
+                       units="m", low=0)
+    shear_exp = Float(0., iotype="in", desc="power law wind shear exponent")
+    yaw = Float(0., iotype="in", desc="rotor yaw angle relative to the wind", units="deg", low=-60, high=60)
+
+    # solver inputs
+    max_iter = Int(5000, iotype="in", desc="maximum number of inflow factor update passes", low=1)
+    tol = Float(1e-8, iotype="in", desc="convergence tolerance on the inflow factor residual", low=0)
+    relax = Float(.3, iotype="in", desc="relaxation factor for the inflow factor update, must be positive",
+                  low=0, high=1)
+    warm_start = Bool(True, iotype="in", desc="start from the induction of the previous execution")
+    a_init = Float(0.2, iotype="in", desc="initial guess for axial inflow factor")
+    b_init = Float(0.01, iotype="in", desc="initial guess for angular inflow factor")
+
+    # outputs
+    azimuth = Array(iotype="out", desc="azimuth of the first blade, zero pointing up", units="deg")
+    thrust = Array(iotype="out", desc="axial thrust per blade at each azimuth step", units="N")
+    torque = Array(iotype="out", desc="shaft torque per blade at each azimuth step", units="N*m")
+    a = Array(iotype="out", desc="axial inflow factors for each element, blade and azimuth step")
+    b = Array(iotype="out", desc="angular inflow factors for each element, blade and azimuth step")
+    net_thrust = Float(iotype="out", desc="revolution averaged rotor thrust", units="N")
+    net_torque = Float(iotype="out", desc="revolution averaged rotor torque", units="N*m")
+    net_power = Float(iotype="out", desc="revolution averaged power produced", units="W")
+    residual = Float(iotype="out", desc="largest unrelaxed inflow factor change in the last pass")
+    n_iter = Int(iotype="out", desc="number of inflow factor update passes used")
+
+    def __init__(self, n_elements=6, n_azimuth=36):
+        super(UnsteadyBEM, self).__init__()
+
+        if n_elements < 2:
+            raise ValueError("UnsteadyBEM needs at least 2 blade elements, got %d" % n_elements)
+        if n_azimuth < 1:
+            raise ValueError("UnsteadyBEM needs at least 1 azimuth step, got %d" % n_azimuth)
+
+        self.add('free_stream', FlowConditions())
+
+        self._n_elements = n_elements
+        self._n_azimuth = n_azimuth
+
+        # induction from the last execution, reused as the next warm start
+        self._a = None
+        self._b = None
+
+    def _flow_angles(self, a, b):
+        """relative flow angle and angle of attack for the current inflow factors"""
+        phi = np.arctan2(self._V_tan + b*self._omega_r, self._V_ax*(1-a))
+        alpha = pi/2 - self._twist - phi
+        return phi, alpha
+
+    def _spread(self, x, B):
+        """shift the first blade's azimuth history onto all B blades, on the second to last axis"""
+        shift = self._n_azimuth//B
+        return np.concatenate([np.roll(x, -k*shift, axis=-1)[..., np.newaxis, :] for k in range(B)], axis=-2)
+
+    def execute(self):
+        if self.hub_height <= self.r_tip:
+            raise ValueError("hub_height (%g m) must be larger than r_tip (%g m)" % (self.hub_height, self.r_tip))
+        if self.relax <= 0:
+            raise ValueError("relax must be positive, got %g" % self.relax)
+        if self.rpm <= 0:
+            raise ValueError("rpm must be positive, got %g" % self.rpm)
+
+        n = self._n_elements
+        n_az = self._n_azimuth
+        B = self.B
+        if n_az % B:
+            raise ValueError("n_azimuth (%d) must be a multiple of the number of blades (%d)" % (n_az, B))
+
+        # element geometry, spaced like the LinearDistributions in AutoBEM;
+        # loads are evaluated at these nodes and integrated along the span
+        r = np.linspace(self.r_hub, self.r_tip, n)
+        chord = np.linspace(self.chord_hub, self.chord_tip, n)
+        twist = np.radians(np.linspace(self.twist_hub, self.twist_tip, n) + self.pitch)
+        sigma = B*chord/(2*pi*r)
+
+        # azimuth of the first blade at each step, zero pointing up
+        psi_0 = np.linspace(0, 2*pi, n_az, endpoint=False)
+        psi = psi_0[np.newaxis, :]
+
+        r2 = r[:, np.newaxis]
+        sigma2 = sigma[:, np.newaxis]
+        omega = self.rpm*2*pi/60.0
+
+        # power law shear, evaluated at the height of every element
+        z = self.hub_height + r2*np.cos(psi)
+        V_loc = self.free_stream.V*(z/self.hub_height)**self.shear_exp
+
+        # yaw splits the local wind into an axial part and a lateral part
+        # that adds to or subtracts from the blade's tangential velocity
+        yaw = np.radians(self.yaw)
+        self._V_ax = V_loc*cos(yaw)
+        if np.any(self._V_ax <= 0):
+            raise ValueError("axial wind speed must be positive everywhere on the rotor")
+        self._V_tan = omega*r2 - V_loc*sin(yaw)*np.cos(psi)
+        self._omega_r = omega*r2 * np.ones_like(psi)
+        self._twist = twist[:, np.newaxis]
+        lambda_r = self._omega_r/self._V_ax
+
+        shape = (n, n_az)
+        if self.warm_start and self._a is not None and self._a.shape == shape:
+            a = self._a
+            b = self._b
+        else:
+            a = np.ones(shape)*self.a_init
+            b = np.ones(shape)*self.b_init
+
+        for i in range(self.max_iter):
+            phi, alpha = self._flow_angles(a, b)
+            C_D, C_L = _coeff_lookup(alpha)
+            cos_phi = np.cos(phi)
+            sin_phi = np.sin(phi)
+
+            # same update as BladeElement._iteration, written so C_L = 0 does
+            # not divide by zero. Where yaw makes the tangential flow reverse
+            # (sin_phi <= 0, near the hub) momentum theory does not apply and
+            # the element is left without induction.
+            lift = sigma2*C_L*sin_phi
+            a_new = np.where(sin_phi > 0, lift/(lift + 4.*cos_phi**2), 0.)
+            b_new = np.where(sin_phi > 0, (sigma2*C_L)/(4*lambda_r*cos_phi)*(1 - a_new), 0.)
+
+            # converge on the fixed point residual, not on the relaxed step
+            delta_a = a_new - a
+            delta_b = b_new - b
+            self.residual = max(np.abs(delta_a).max(), np.abs(delta_b).max())
+            if self.residual < self.tol:
+                a = a_new
+                b = b_new
+                break
+
+            a = a + self.relax*delta_a
+            b = b + self.relax*delta_b
+        else:
+            raise RuntimeError("UnsteadyBEM did not converge in %d passes, residual %g > tol %g" %
+                               (self.max_iter, self.residual, self.tol))
+
+        self.n_iter = i + 1
+        self._a = a
+        self._b = b
+
+        phi, alpha = self._flow_angles(a, b)
+        C_D, C_L = _coeff_lookup(alpha)
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+
+        # phi is measured from the rotor axis
+        V_0 = self._V_ax*(1 - a)
+        V_2 = self._V_tan + b*self._omega_r
+        # loads per unit span at each node
+        q_c = .5*self.free_stream.rho*(V_0**2 + V_2**2)*chord[:, np.newaxis]
+        dT = q_c*(C_L*sin_phi + C_D*cos_phi)
+        dQ = q_c*(C_L*cos_phi - C_D*sin_phi)*r2
+
+        self.a = self._spread(a, B)
+        self.b = self._spread(b, B)
+        self.azimuth = np.degrees(psi_0)
+        self.thrust = self._spread(np.trapz(dT, x=r, axis=0), B)
+        self.torque = self._spread(np.trapz(dQ, x=r, axis=0), B)
+
+        self.net_thrust = self.thrust.sum(axis=0).mean()
+        self.net_torque = self.torque.sum(axis=0).mean()
+        self.net_power = self.net_torque*omega
+
+
 if __name__ == "__main__":
 
     top = Assembly()
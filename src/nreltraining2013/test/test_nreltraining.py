@@ -1,5 +1,8 @@
 
 import unittest
+from math import pi, sin, cos
+
+import numpy as np
 
 
 from openmdao.main.api import Assembly, set_as_top
@@ -84,6 +87,137 @@ class AutoBEMTestCase(unittest.TestCase):
         assert_rel_error(self, self.top.b.data.Cp, 0.57, 0.01)
 
 
+class UnsteadyBEMTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.top = set_as_top(Assembly())
+        self.top.add('b', UnsteadyBEM())
+        self.top.driver.workflow.add('b')
+
+    def test_UnsteadyBEM_uniform(self):
+        self.top.run()
+        b = self.top.b
+
+        self.assertEqual(b.thrust.shape, (3, 36))
+        self.assertTrue(np.allclose(b.azimuth, np.arange(0, 360, 10)))
+
+        # axisymmetric inflow gives the same loads at every azimuth step
+        assert_rel_error(self, b.thrust.min(), b.thrust.max(), 1e-6)
+        assert_rel_error(self, b.torque.min(), b.torque.max(), 1e-6)
+        assert_rel_error(self, b.net_thrust, b.thrust.sum(axis=0).mean(), 1e-12)
+        assert_rel_error(self, b.net_torque, b.torque.sum(axis=0).mean(), 1e-12)
+        assert_rel_error(self, b.net_power, b.net_torque*b.rpm*2*pi/60, 1e-12)
+
+    def test_UnsteadyBEM_vs_BladeElement(self):
+        self.top.run()
+        b = self.top.b
+
+        r = np.linspace(b.r_hub, b.r_tip, 6)
+        chord = np.linspace(b.chord_hub, b.chord_tip, 6)
+        twist = np.radians(np.linspace(b.twist_hub, b.twist_tip, 6))
+        V = b.free_stream.V
+        rho = b.free_stream.rho
+        omega = b.rpm*2*pi/60
+
+        # solve each node with BladeElement
+        a = np.zeros(6)
+        b_ = np.zeros(6)
+        for i in range(6):
+            be = BladeElement()
+            be.r = r[i]
+            be.chord = chord[i]
+            be.twist = twist[i]
+            be.rpm = b.rpm
+            be.B = b.B
+            be.V_inf = V
+            be.rho = rho
+            be.execute()
+
+            assert_rel_error(self, b.a[i, 0, 0], be.a, 1e-4)
+            assert_rel_error(self, b.b[i, 0, 0], be.b, 1e-4)
+            a[i] = be.a
+            b_[i] = be.b
+
+        # annulus momentum theory, independent of the blade element loads;
+        # the two agree where the drag coefficient is zero, i.e. all but the
+        # hub node
+        thrust = np.trapz(4*pi*r*rho*V**2*a*(1 - a), x=r)
+        torque = np.trapz(4*pi*r**3*rho*V*omega*b_*(1 - a), x=r)
+        assert_rel_error(self, b.net_thrust, thrust, 1e-4)
+        assert_rel_error(self, b.net_torque, torque, 1e-4)
+
+    def test_UnsteadyBEM_warm_start(self):
+        self.top.run()
+        self.assertTrue(self.top.b.n_iter > 1)
+        thrust = self.top.b.net_thrust
+
+        # unchanged inputs start from the converged induction
+        self.top.run()
+        self.assertEqual(self.top.b.n_iter, 1)
+        self.assertTrue(self.top.b.residual < self.top.b.tol)
+        assert_rel_error(self, self.top.b.net_thrust, thrust, 1e-6)
+
+        self.top.b.warm_start = False
+        self.top.run()
+        self.assertTrue(self.top.b.n_iter > 1)
+
+    def test_UnsteadyBEM_relax(self):
+        self.top.run()
+        power = self.top.b.net_power
+
+        # a small relaxation factor converges to the same answer
+        self.top.b.warm_start = False
+        self.top.b.relax = .02
+        self.top.run()
+        assert_rel_error(self, self.top.b.net_power, power, 1e-6)
+
+        # and a vanishing one must not report the initial guess as converged
+        self.top.b.relax = 1e-9
+        self.top.b.max_iter = 50
+        self.assertRaises(RuntimeError, self.top.b.execute)
+
+        self.top.b.relax = 0.
+        self.assertRaises(ValueError, self.top.b.execute)
+
+    def test_UnsteadyBEM_shear(self):
+        self.top.b.shear_exp = .2
+        self.top.b.hub_height = 8.
+        self.top.run()
+
+        # blade pointing up sees more wind than blade pointing down
+        self.assertTrue(self.top.b.thrust[0, 0] > self.top.b.thrust[0, 18])
+
+    def test_UnsteadyBEM_yaw(self):
+        self.top.run()
+        power = self.top.b.net_power
+
+        self.top.b.yaw = 20.
+        self.top.run()
+        thrust = self.top.b.thrust.copy()
+        yaw_power = self.top.b.net_power
+        self.assertTrue(yaw_power < power)
+
+        # yaw makes the loads vary around the revolution
+        self.assertTrue(thrust.max() - thrust.min() > .1*thrust.mean())
+
+        # without shear, -yaw is +yaw seen half a revolution later
+        self.top.b.yaw = -20.
+        self.top.run()
+        self.assertTrue(np.allclose(np.roll(self.top.b.thrust, 18, axis=1), thrust, rtol=1e-6))
+        assert_rel_error(self, self.top.b.net_power, yaw_power, 1e-6)
+
+    def test_UnsteadyBEM_errors(self):
+        self.assertRaises(ValueError, UnsteadyBEM, n_elements=1)
+        self.assertRaises(ValueError, UnsteadyBEM, n_azimuth=0)
+
+        self.top.b.hub_height = self.top.b.r_tip
+        self.assertRaises(ValueError, self.top.b.execute)
+
+        self.top.b.hub_height = 30.
+        self.top.b.rpm = 0.
+        self.assertRaises(ValueError, self.top.b.execute)
+
+
 if __name__ == '__main__':
     unittest.main()
 